@@ -1,10 +1,27 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import io
 import re
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils.dataframe import dataframe_to_rows
+import hashlib
+from charset_normalizer import from_bytes
+import xlsxwriter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+# Prefer the Rust-backed calamine reader for .xlsx when it is installed
+try:
+    import python_calamine
+    EXCEL_ENGINE = 'calamine'
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
+
+# Parse CSVs with the multithreaded Arrow reader when pyarrow is installed
+try:
+    import pyarrow
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
 
 # Page configuration
 st.set_page_config(page_title="HackerRank Monthly Report Combiner", layout="wide")
@@ -45,6 +62,33 @@ st.markdown("""
 st.markdown('<h1 class="main-header">📊 HackerRank Monthly Report Combiner</h1>', unsafe_allow_html=True)
 st.markdown('<p class="sub-header">Upload your weekly HackerRank CSV or Excel reports to generate a combined monthly report based on 6-digit roll numbers.</p>', unsafe_allow_html=True)
 
+ROLL_SAMPLE_SIZE = 200
+SERIAL_PATTERNS = ['s.no', 'serial', 'sno', 'sr.no', 'sr no', 'slno', 'sl.no', 'sl no']
+# One alternation search per column name instead of a substring test per pattern
+SERIAL_COLUMN_RE = re.compile('|'.join(re.escape(pattern) for pattern in SERIAL_PATTERNS))
+ROLL_NUMBER_COL = 'roll_number'
+MISSING_SCORE = "-"
+CSV_CHUNK_SIZE = 10_000
+MAX_WORKERS = 8
+# Caches are shared by all sessions, so bound them to keep memory flat on small hosts
+PARSE_CACHE_ENTRIES = 32
+EXPORT_CACHE_ENTRIES = 8
+CACHE_TTL = 3600
+
+EXCEL_HEADER_FORMAT = {
+    'bold': True,
+    'font_color': 'white',
+    'bg_color': '#2E86AB',
+    'align': 'center',
+    'valign': 'vcenter',
+    'border': 1
+}
+EXCEL_CELL_FORMAT = {
+    'align': 'center',
+    'valign': 'vcenter',
+    'border': 1
+}
+
 # File uploader
 uploaded_files = st.file_uploader(
     "📁 Upload CSV or Excel files (Weekly Reports)",
@@ -53,32 +97,72 @@ uploaded_files = st.file_uploader(
     help="Upload multiple files containing weekly HackerRank scores. Each file should have a 6-digit roll number column."
 )
 
-def read_file(file):
-    """Read CSV or Excel file and return DataFrame"""
+def detect_encoding(raw):
+    """Detect the text encoding of raw CSV bytes from its BOM or a leading sample"""
+    if raw[:3] == b'\xef\xbb\xbf':
+        return 'utf-8-sig'
+    if raw[:2] in (b'\xff\xfe', b'\xfe\xff'):
+        return 'utf-16'
+    
+    sample = raw[:65536]
     try:
-        if file.name.endswith(".csv"):
-            # Try different encodings
-            encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-            for encoding in encodings:
-                try:
-                    content = file.getvalue().decode(encoding)
-                    return pd.read_csv(io.StringIO(content))
-                except UnicodeDecodeError:
-                    continue
-            # If all encodings fail, try with errors='ignore'
-            content = file.getvalue().decode('utf-8', errors='ignore')
-            return pd.read_csv(io.StringIO(content))
-        elif file.name.endswith(".xlsx"):
-            return pd.read_excel(file)
-    except Exception as e:
-        st.error(f"❌ Error reading file {file.name}: {str(e)}")
-        return None
+        sample.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError as e:
+        # A multi-byte character cut off at the sample boundary is still UTF-8
+        if e.start >= len(sample) - 3 and len(raw) > len(sample):
+            return 'utf-8'
+    
+    best = from_bytes(sample).best()
+    return best.encoding if best is not None else 'latin-1'
+
+def read_csv(raw, encoding):
+    """Parse CSV bytes with the given encoding, raising UnicodeDecodeError on bad text"""
+    if CSV_ENGINE == 'pyarrow':
+        try:
+            df = pd.read_csv(io.BytesIO(raw), encoding=encoding, engine='pyarrow')
+        except UnicodeDecodeError:
+            raise
+        except ValueError:
+            # The Arrow reader is stricter (e.g. ragged rows); retry with the C parser
+            df = None
+        
+        if df is not None and df.columns.duplicated().any():
+            # Arrow keeps repeated headers as-is; the C parser renames them (score, score.1)
+            df = None
+        
+        if df is not None:
+            # Arrow returns text that fails to decode as a column of raw bytes instead of raising
+            for col in df.columns:
+                if pd.api.types.infer_dtype(df[col], skipna=True) == 'bytes':
+                    raise UnicodeDecodeError(encoding, b'', 0, 0, f"undecodable text in column {col!r}")
+            return df
+    
+    return pd.read_csv(io.BytesIO(raw), encoding=encoding)
+
+@st.cache_data(show_spinner=False, max_entries=PARSE_CACHE_ENTRIES, ttl=CACHE_TTL)
+def parse_file(name, raw):
+    """Parse raw CSV or Excel bytes into a DataFrame (cached across reruns)"""
+    if name.endswith(".csv"):
+        # Let pandas decode the bytes once with the detected encoding
+        try:
+            return read_csv(raw, detect_encoding(raw))
+        except UnicodeDecodeError:
+            # The encoding was guessed from a sample; latin-1 decodes any byte
+            return read_csv(raw, 'latin-1')
+    elif name.endswith(".xlsx"):
+        return pd.read_excel(io.BytesIO(raw), engine=EXCEL_ENGINE)
 
 def standardize_columns(df):
     """Standardize column names by removing extra spaces and converting to lowercase"""
     df.columns = df.columns.str.strip().str.lower()
     return df
 
+def is_roll_number(str_series):
+    """Return a boolean mask of values that are exactly 6 digits"""
+    # Length and digit checks are plain C loops, cheaper than a regex match
+    return (str_series.str.len() == 6) & str_series.str.isdecimal()
+
 def find_roll_number_column(df):
     """Find the roll number column in the DataFrame"""
     # First, check for columns with 'roll' in the name
@@ -86,18 +170,22 @@ def find_roll_number_column(df):
         if 'roll' in col.lower():
             return col
     
-    # Then, check for columns with 6-digit numbers
-    for col in df.columns:
+    # Then, check text (object or string dtype) and integer columns for 6-digit numbers;
+    # this scan only runs when no column is named after roll numbers
+    candidate_cols = [
+        col for col in df.columns
+        if pd.api.types.is_object_dtype(df[col])
+        or pd.api.types.is_string_dtype(df[col])
+        or pd.api.types.is_integer_dtype(df[col])
+    ]
+    for col in candidate_cols:
         try:
-            # Convert to string and check if most values are 6-digit numbers
-            str_series = df[col].astype(str).str.strip()
-            # Remove any NaN values
-            str_series = str_series.dropna()
+            # Sample the first non-null values instead of scanning the whole column
+            str_series = df[col].dropna().head(ROLL_SAMPLE_SIZE).astype(str).str.strip()
             if len(str_series) == 0:
                 continue
             # Check if at least 70% of values are 6-digit numbers
-            six_digit_count = str_series.str.match(r'^\d{6}$').sum()
-            if six_digit_count / len(str_series) >= 0.7:
+            if is_roll_number(str_series).mean() >= 0.7:
                 return col
         except:
             continue
@@ -110,11 +198,24 @@ def clean_roll_numbers(df, roll_col):
     df[roll_col] = df[roll_col].astype(str).str.strip()
     
     # Remove rows with invalid roll numbers
-    valid_pattern = r'^\d{6}$'
-    df = df[df[roll_col].str.match(valid_pattern, na=False)]
+    df = df[is_roll_number(df[roll_col])]
+    
+    # Validated 6-digit roll numbers fit in int32, which joins far faster than strings
+    df = df.astype({roll_col: np.int32})
     
     return df
 
+def is_sequential(values):
+    """Check whether values are exactly 1..N in any order, without sorting"""
+    n = len(values)
+    return (
+        n > 1
+        and values.min() == 1
+        and values.max() == n
+        and values.sum() == n * (n + 1) // 2
+        and values.is_unique
+    )
+
 def identify_score_columns(df, roll_col):
     """Identify valid score columns (numeric, not serial numbers)"""
     # Get all numeric columns
@@ -125,22 +226,18 @@ def identify_score_columns(df, roll_col):
         numeric_cols.remove(roll_col)
     
     # Remove serial number columns
-    serial_patterns = ['s.no', 'serial', 'sno', 'sr.no', 'sr no', 'slno', 'sl.no', 'sl no']
     valid_cols = []
     
     for col in numeric_cols:
         col_lower = col.lower()
-        is_serial = any(pattern in col_lower for pattern in serial_patterns)
+        is_serial = SERIAL_COLUMN_RE.search(col_lower) is not None
         
         # Additional check: if column values are sequential (1, 2, 3, ...), it's likely a serial number
         if not is_serial:
             try:
                 values = df[col].dropna().astype(int)
-                if len(values) > 1:
-                    # Check if values are sequential starting from 1
-                    expected_sequence = list(range(1, len(values) + 1))
-                    if list(values.sort_values()) == expected_sequence:
-                        is_serial = True
+                if is_sequential(values):
+                    is_serial = True
             except:
                 pass
         
@@ -149,137 +246,238 @@ def identify_score_columns(df, roll_col):
     
     return valid_cols
 
-def create_styled_excel(df, filename):
+def downcast_score_columns(df, score_cols):
+    """Downcast whole-number score columns to the smallest exact numeric dtype"""
+    for col in score_cols:
+        values = df[col]
+        non_null = values.dropna()
+        # Fractional scores stay float64; float32 would add rounding noise to exports
+        if not (non_null % 1 == 0).all():
+            continue
+        if len(non_null) == len(values):
+            df[col] = pd.to_numeric(values, downcast='integer')
+        elif non_null.abs().max() < 2 ** 24:
+            # float32 represents every integer below 2**24 exactly
+            df[col] = pd.to_numeric(values, downcast='float')
+    return df
+
+def compute_column_widths(df, na_rep=MISSING_SCORE, max_width=20):
+    """Compute Excel column widths from the longest header or value in each column"""
+    widths = []
+    for col in df.columns:
+        # Vectorized string length scan instead of measuring each cell in Python
+        values = df[col]
+        lengths = values.astype(str).str.len().where(values.notna(), len(na_rep))
+        max_length = lengths.max()
+        if pd.isna(max_length):
+            max_length = 0
+        widths.append(min(max(int(max_length), len(str(col))) + 2, max_width))
+    return widths
+
+@st.cache_data(show_spinner=False, max_entries=EXPORT_CACHE_ENTRIES, ttl=CACHE_TTL)
+def create_styled_excel(df, filename, na_rep=MISSING_SCORE):
     """Create a styled Excel file"""
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Monthly Report"
-    
-    # Add data to worksheet
-    for r in dataframe_to_rows(df, index=False, header=True):
-        ws.append(r)
-    
-    # Style the header row
-    header_font = Font(bold=True, color="FFFFFF")
-    header_fill = PatternFill("solid", fgColor="2E86AB")
-    header_alignment = Alignment(horizontal="center", vertical="center")
-    
-    # Apply header styling
-    for cell in ws[1]:
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = header_alignment
-    
-    # Add borders and center alignment for all cells
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
-    
-    center_alignment = Alignment(horizontal="center", vertical="center")
+    output = io.BytesIO()
+    # constant_memory flushes each row once the next one starts, so only the
+    # current row is held in memory. Rows must therefore be written in order and
+    # column widths set up front. in_memory is left off because it disables this.
+    wb = xlsxwriter.Workbook(output, {'constant_memory': True})
+    ws = wb.add_worksheet("Monthly Report")
     
-    for row in ws.iter_rows():
-        for cell in row:
-            cell.border = thin_border
-            cell.alignment = center_alignment
+    header_format = wb.add_format(EXCEL_HEADER_FORMAT)
+    cell_format = wb.add_format(EXCEL_CELL_FORMAT)
     
     # Auto-adjust column widths
-    for column in ws.columns:
-        max_length = 0
-        column_letter = column[0].column_letter
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-        adjusted_width = min(max_length + 2, 20)
-        ws.column_dimensions[column_letter].width = adjusted_width
+    for col_idx, width in enumerate(compute_column_widths(df, na_rep)):
+        # The column format styles every body cell written without its own format
+        ws.set_column(col_idx, col_idx, width, cell_format)
+    
+    # Write header and data rows
+    ws.write_row(0, 0, df.columns.tolist(), header_format)
+    for row_idx, row in enumerate(df.itertuples(index=False, name=None), start=1):
+        # Missing scores stay NaN in the DataFrame and are only rendered here (NaN != NaN)
+        ws.write_row(row_idx, 0, [na_rep if value != value else value for value in row])
     
-    # Save to BytesIO
+    wb.close()
+    return output.getvalue()
+
+@st.cache_data(show_spinner=False, max_entries=EXPORT_CACHE_ENTRIES, ttl=CACHE_TTL)
+def create_csv(df, na_rep=MISSING_SCORE):
+    """Serialize the report to CSV bytes in chunks"""
     output = io.BytesIO()
-    wb.save(output)
-    output.seek(0)
+    df.to_csv(output, index=False, na_rep=na_rep, chunksize=CSV_CHUNK_SIZE, lineterminator='\n')
     return output.getvalue()
 
+def merge_weekly_data(weekly_data):
+    """Outer-join all weekly DataFrames on their roll number index"""
+    # Every roll number seen in any week, sorted
+    roll_numbers = np.unique(np.concatenate([week_df.index.to_numpy() for week_df in weekly_data]))
+    columns = [col for week_df in weekly_data for col in week_df.columns]
+    
+    # Smallest float type that holds every week's scores exactly (NaN marks missing weeks)
+    week_dtypes = {dtype for week_df in weekly_data for dtype in week_df.dtypes}
+    dtype = np.result_type(np.float32, *week_dtypes)
+    
+    # Fill one preallocated block, writing each week into its own column slice
+    scores = np.full((len(roll_numbers), len(columns)), np.nan, dtype=dtype)
+    start = 0
+    for week_df in weekly_data:
+        stop = start + len(week_df.columns)
+        rows = np.searchsorted(roll_numbers, week_df.index.to_numpy())
+        scores[rows, start:stop] = week_df.to_numpy(dtype=dtype)
+        start = stop
+    
+    merged_df = pd.DataFrame(scores, columns=columns)
+    
+    # Columns with no missing students keep their integer dtype (10, not 10.0)
+    column_dtypes = [dtype for week_df in weekly_data for dtype in week_df.dtypes]
+    complete = ~np.isnan(scores).any(axis=0)
+    merged_df = merged_df.astype({
+        col: col_dtype
+        for col, col_dtype, is_complete in zip(columns, column_dtypes, complete)
+        if is_complete and pd.api.types.is_integer_dtype(col_dtype)
+    })
+    
+    # Restore leading zeros dropped by the integer conversion
+    merged_df.insert(0, 'Roll Number', pd.Series(roll_numbers).astype(str).str.zfill(6))
+    
+    return merged_df
+
+def get_upload_key(files):
+    """Fingerprint the uploaded files by name, size and content hash"""
+    return tuple(
+        (file.name, file.size, hashlib.blake2b(file.getvalue(), digest_size=16).digest())
+        for file in files
+    )
+
+class FileProcessingError(Exception):
+    """Raised when an uploaded file cannot be turned into weekly score data"""
+
+def process_file(idx, file):
+    """Read, validate and reshape one uploaded file into its weekly score DataFrame"""
+    # Read file; plain bytes are passed so the cache hashes content, not the upload object
+    try:
+        df = parse_file(file.name, file.getvalue())
+    except Exception as e:
+        raise FileProcessingError(f"❌ Error reading file {file.name}: {str(e)}")
+    if df is None:
+        raise FileProcessingError(f"❌ Unsupported file type: **{file.name}**")
+    
+    # Store original row count
+    original_rows = len(df)
+    
+    # Standardize columns
+    df = standardize_columns(df)
+    
+    # Find roll number column
+    current_roll_col = find_roll_number_column(df)
+    if not current_roll_col:
+        raise FileProcessingError(f"❌ Could not detect a 6-digit roll number column in **{file.name}**. Please ensure there's a column with 6-digit roll numbers or rename the column to include 'roll'.")
+    
+    # Rename roll number column to standard name
+    df.rename(columns={current_roll_col: ROLL_NUMBER_COL}, inplace=True)
+    
+    # Clean roll numbers
+    df = clean_roll_numbers(df, ROLL_NUMBER_COL)
+    
+    # Keep the first row per student so weekly frames can be joined on the roll number;
+    # the dropped rows are counted and reported to the user
+    duplicates = df[ROLL_NUMBER_COL].duplicated()
+    duplicate_rows = int(duplicates.sum())
+    df = df[~duplicates]
+    
+    if len(df) == 0:
+        raise FileProcessingError(f"❌ No valid 6-digit roll numbers found in **{file.name}**")
+    
+    # Identify score columns
+    score_cols = identify_score_columns(df, ROLL_NUMBER_COL)
+    
+    if len(score_cols) == 0:
+        raise FileProcessingError(f"❌ No valid numeric score columns found in **{file.name}**")
+    
+    # Shrink score columns to the smallest dtype that holds them exactly
+    df = downcast_score_columns(df, score_cols)
+    
+    # Rename score columns to include week number
+    renamed_cols = {}
+    for col in score_cols:
+        renamed_cols[col] = f"File {idx + 1} - {col.title()}"
+    
+    # Create week-specific dataframe; column selection already returns a new frame
+    week_df = (
+        df[[ROLL_NUMBER_COL] + score_cols]
+        .set_index(ROLL_NUMBER_COL)
+        .rename(columns=renamed_cols)
+    )
+    
+    # Store file information
+    file_info = {
+        'file': file.name,
+        'original_rows': original_rows,
+        'valid_rows': len(week_df),
+        'duplicate_rows': duplicate_rows,
+        'score_columns': len(score_cols),
+        'column_names': list(renamed_cols.values())
+    }
+    
+    return week_df, file_info
+
 # Main processing logic
 if uploaded_files:
     st.markdown("---")
-    st.markdown("### 📋 Processing Files...")
-    
-    # Progress bar
-    progress_bar = st.progress(0)
-    status_text = st.empty()
     
-    weekly_data = []
-    roll_number_col = None
-    file_info = []
-    
-    for idx, file in enumerate(uploaded_files):
-        status_text.text(f"Processing file {idx + 1}/{len(uploaded_files)}: {file.name}")
-        progress_bar.progress((idx + 1) / len(uploaded_files))
+    # Streamlit reruns the script on every widget click; only reprocess when the uploads change
+    upload_key = get_upload_key(uploaded_files)
+    if st.session_state.get('upload_key') != upload_key:
+        st.markdown("### 📋 Processing Files...")
         
-        # Read file
-        df = read_file(file)
-        if df is None:
-            st.stop()
+        # Progress bar
+        progress_bar = st.progress(0)
+        status_text = st.empty()
         
-        # Store original column count
-        original_cols = len(df.columns)
-        original_rows = len(df)
-        
-        # Standardize columns
-        df = standardize_columns(df)
-        
-        # Find roll number column
-        current_roll_col = find_roll_number_column(df)
-        if not current_roll_col:
-            st.error(f"❌ Could not detect a 6-digit roll number column in **{file.name}**. Please ensure there's a column with 6-digit roll numbers or rename the column to include 'roll'.")
-            st.stop()
-        
-        # Set roll number column for consistency
-        if roll_number_col is None:
-            roll_number_col = 'roll_number'
-        
-        # Rename roll number column to standard name
-        df.rename(columns={current_roll_col: roll_number_col}, inplace=True)
-        
-        # Clean roll numbers
-        df = clean_roll_numbers(df, roll_number_col)
-        
-        if len(df) == 0:
-            st.error(f"❌ No valid 6-digit roll numbers found in **{file.name}**")
-            st.stop()
-        
-        # Identify score columns
-        score_cols = identify_score_columns(df, roll_number_col)
+        # Parse and validate files concurrently; pandas and the file parsers release the GIL
+        results = [None] * len(uploaded_files)
+        errors = {}
+        ctx = get_script_run_ctx()
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_WORKERS, len(uploaded_files)),
+            initializer=add_script_run_ctx,
+            initargs=(None, ctx)
+        ) as executor:
+            futures = {
+                executor.submit(process_file, idx, file): idx
+                for idx, file in enumerate(uploaded_files)
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                idx = futures[future]
+                status_text.text(f"Processed file {done}/{len(uploaded_files)}: {uploaded_files[idx].name}")
+                progress_bar.progress(done / len(uploaded_files))
+                
+                try:
+                    results[idx] = future.result()
+                except FileProcessingError as e:
+                    errors[idx] = e
         
-        if len(score_cols) == 0:
-            st.error(f"❌ No valid numeric score columns found in **{file.name}**")
+        # Report the first invalid file in upload order, not whichever failed first
+        if errors:
+            st.error(str(errors[min(errors)]))
             st.stop()
         
-        # Create week-specific dataframe
-        week_df = df[[roll_number_col] + score_cols].copy()
-        
-        # Rename score columns to include week number
-        renamed_cols = {}
-        for col in score_cols:
-            renamed_cols[col] = f"File {idx + 1} - {col.title()}"
+        weekly_data = [week_df for week_df, _ in results]
+        file_info = [info for _, info in results]
         
-        week_df.rename(columns=renamed_cols, inplace=True)
+        # Merge all weekly data
+        status_text.text("Combining weekly reports...")
+        merged_df = merge_weekly_data(weekly_data)
         
-        # Store file information
-        file_info.append({
-            'file': file.name,
-            'original_rows': original_rows,
-            'valid_rows': len(week_df),
-            'score_columns': len(score_cols),
-            'column_names': list(renamed_cols.values())
-        })
+        # Clear progress indicators
+        progress_bar.empty()
+        status_text.empty()
         
-        weekly_data.append(week_df)
+        st.session_state.update(upload_key=upload_key, merged_df=merged_df, file_info=file_info)
+    
+    merged_df = st.session_state['merged_df']
+    file_info = st.session_state['file_info']
     
     # Display file processing summary
     st.markdown("### 📊 File Processing Summary")
@@ -288,29 +486,16 @@ if uploaded_files:
             'File Name': info['file'],
             'Original Rows': info['original_rows'],
             'Valid Rows': info['valid_rows'],
+            'Duplicate Rows': info['duplicate_rows'],
             'Score Columns': info['score_columns']
         }
         for info in file_info
     ])
     st.dataframe(summary_df, use_container_width=True)
     
-    # Merge all weekly data
-    status_text.text("Combining weekly reports...")
-    merged_df = weekly_data[0]
-    
-    for df in weekly_data[1:]:
-        merged_df = pd.merge(merged_df, df, on=roll_number_col, how='outer')
-    
-    # Fill missing values and sort
-    merged_df = merged_df.fillna("-")
-    merged_df = merged_df.sort_values(by=roll_number_col)
-    
-    # Rename roll number column to display name
-    merged_df.rename(columns={roll_number_col: 'Roll Number'}, inplace=True)
-    
-    # Clear progress indicators
-    progress_bar.empty()
-    status_text.empty()
+    for info in file_info:
+        if info['duplicate_rows']:
+            st.warning(f"⚠️ **{info['file']}** has {info['duplicate_rows']} row(s) with a repeated roll number. Only the first row for each roll number was used.")
     
     # Display success message
     st.success("✅ Successfully combined all weekly reports!")
@@ -326,7 +511,15 @@ if uploaded_files:
     
     # Display combined data
     st.markdown("### 📈 Combined Monthly Report")
-    st.dataframe(merged_df, use_container_width=True)
+    # Scores stay numeric; missing weeks show as blank cells rather than "-"
+    st.dataframe(
+        merged_df,
+        use_container_width=True,
+        column_config={
+            col: st.column_config.NumberColumn(col, help="Blank means no score in that file")
+            for col in merged_df.columns[1:]
+        }
+    )
     
     # Download button
     st.markdown("### 📥 Download Report")
@@ -352,6 +545,7 @@ if uploaded_files:
                 with st.expander(f"📄 {info['file']}"):
                     st.write(f"**Original Rows:** {info['original_rows']}")
                     st.write(f"**Valid Rows:** {info['valid_rows']}")
+                    st.write(f"**Duplicate Rows:** {info['duplicate_rows']}")
                     st.write(f"**Score Columns:** {info['score_columns']}")
                     st.write("**Column Names:**")
                     for col in info['column_names']:
@@ -359,7 +553,7 @@ if uploaded_files:
     
     with col2:
         # CSV download option
-        csv_data = merged_df.to_csv(index=False)
+        csv_data = create_csv(merged_df)
         st.download_button(
             label="📄 Download as CSV",
             data=csv_data,